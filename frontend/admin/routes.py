@@ -5,14 +5,48 @@ from typing import List, Optional, Dict
 from datetime import datetime
 import json
 import sqlite3
+import time
 from pathlib import Path
 
+from frontend import cache
 from frontend.database import get_db, init_db
 from frontend.models import Tournament, TriviaQuestion, Player
 from bmg.database import Database
 
 admin_router = APIRouter()
 
+# The tournament columns the templates actually use; selecting these
+# explicitly instead of * keeps SQLite from decoding columns we ignore
+_TOURNAMENT_COLS = (
+    "id, name, start_time, end_time, duration_days, questions_per_day, "
+    "source_distribution, bonus_first, bonus_second, bonus_third, is_active, "
+    "total_rounds"
+)
+
+# Cached (expiry, categories) for the trivia category dropdowns. Categories
+# change rarely, so a short TTL avoids re-scanning trivia_questions on every
+# form render. Set to None to invalidate (done after inserts/deletes).
+_CAT_CACHE_TTL = 60  # seconds
+_CAT_CACHE: Optional[tuple] = None
+
+
+def _get_categories(cursor) -> List[str]:
+    """Get the distinct trivia categories, cached with a short TTL"""
+    global _CAT_CACHE
+    if _CAT_CACHE is not None and time.monotonic() < _CAT_CACHE[0]:
+        return _CAT_CACHE[1]
+
+    cursor.execute("SELECT DISTINCT category FROM trivia_questions ORDER BY category")
+    categories = [row[0] for row in cursor.fetchall()]
+    _CAT_CACHE = (time.monotonic() + _CAT_CACHE_TTL, categories)
+    return categories
+
+
+def _invalidate_categories():
+    """Drop the category cache after a write to trivia_questions"""
+    global _CAT_CACHE
+    _CAT_CACHE = None
+
 @admin_router.post("/init-db")
 async def initialize_database():
     """Initialize or update the database schema"""
@@ -99,9 +133,9 @@ async def admin_dashboard(request: Request):
         active_tournaments = []
         try:
             cursor.execute(
-                """
-                SELECT * FROM tournaments 
-                WHERE start_time <= strftime('%s', 'now') 
+                f"""
+                SELECT {_TOURNAMENT_COLS} FROM tournaments
+                WHERE start_time <= strftime('%s', 'now')
                 AND end_time >= strftime('%s', 'now')
                 AND is_active = TRUE
                 ORDER BY start_time DESC
@@ -128,7 +162,7 @@ async def admin_dashboard(request: Request):
                 """
                 SELECT r.id, r.start_time, r.source_name, r.question_text, 
                        COUNT(pr.id) as response_count,
-                       SUM(CASE WHEN pr.correct = TRUE THEN 1 ELSE 0 END) as correct_count
+                       COALESCE(SUM(pr.correct), 0) as correct_count
                 FROM rounds r
                 LEFT JOIN player_responses pr ON r.id = pr.round_id
                 GROUP BY r.id
@@ -162,11 +196,9 @@ async def list_tournaments(request: Request):
     with get_db() as conn:
         try:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, start_time, end_time, duration_days, questions_per_day, 
-                       source_distribution, bonus_first, bonus_second, bonus_third, is_active,
-                       total_rounds
-                FROM tournaments 
+            cursor.execute(f"""
+                SELECT {_TOURNAMENT_COLS}
+                FROM tournaments
                 ORDER BY start_time DESC
             """)
             for row in cursor.fetchall():
@@ -219,13 +251,6 @@ async def create_tournament(
             "trivia": float(trivia_weight)
         }
         
-        # Format the date properly for SQLite
-        try:
-            parsed_date = datetime.fromisoformat(start_date)
-            formatted_date = parsed_date.isoformat()
-        except ValueError:
-            formatted_date = start_date  # Use as-is if already in correct format
-        
         with get_db() as conn:
             cursor = conn.cursor()
             # Convert start_date to Unix timestamp
@@ -239,6 +264,7 @@ async def create_tournament(
                     source_distribution, bonus_first, bonus_second, bonus_third, is_active,
                     total_rounds
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, TRUE, 0)
+                RETURNING id
                 """,
                 (
                     name,
@@ -252,9 +278,10 @@ async def create_tournament(
                     bonus_third
                 )
             )
+            tournament_id = cursor.fetchone()[0]
             conn.commit()
-            tournament_id = cursor.lastrowid
-        
+        cache.clear()
+
         return RedirectResponse(url=f"/admin/tournaments/{tournament_id}", status_code=303)
     except Exception as e:
         print(f"Error creating tournament: {e}")
@@ -278,13 +305,7 @@ async def view_tournament(request: Request, tournament_id: int):
         cursor = conn.cursor()
         # Get tournament details
         cursor.execute(
-            """
-            SELECT id, name, start_time, end_time, duration_days, questions_per_day, 
-                   source_distribution, bonus_first, bonus_second, bonus_third, is_active,
-                   total_rounds
-            FROM tournaments 
-            WHERE id = ?
-            """,
+            f"SELECT {_TOURNAMENT_COLS} FROM tournaments WHERE id = ?",
             (tournament_id,)
         )
         row = cursor.fetchone()
@@ -328,7 +349,7 @@ async def view_tournament(request: Request, tournament_id: int):
                     """
                     SELECT p.id, p.handle, p.display_name, p.total_points,
                            COUNT(pr.id) as responses,
-                           SUM(CASE WHEN pr.correct = TRUE THEN 1 ELSE 0 END) as correct_responses
+                           COALESCE(SUM(pr.correct), 0) as correct_responses
                     FROM players p
                     LEFT JOIN player_responses pr ON p.id = pr.player_id
                     WHERE pr.round_id IN (SELECT id FROM rounds WHERE tournament_id = ?)
@@ -403,14 +424,18 @@ async def update_tournament(
                 )
             )
             conn.commit()
-        
+        cache.clear()
+
         return RedirectResponse(url=f"/admin/tournaments/{tournament_id}", status_code=303)
     except Exception as e:
         print(f"Error updating tournament: {e}")
         # Fetch the tournament again to redisplay the form with error
         with get_db() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tournaments WHERE id = ?", (tournament_id,))
+            cursor.execute(
+                f"SELECT {_TOURNAMENT_COLS} FROM tournaments WHERE id = ?",
+                (tournament_id,)
+            )
             row = cursor.fetchone()
             tournament = dict(row) if row else None
         
@@ -429,7 +454,7 @@ async def edit_tournament_form(request: Request, tournament_id: int):
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT * FROM tournaments WHERE id = ?", 
+            f"SELECT {_TOURNAMENT_COLS} FROM tournaments WHERE id = ?",
             (tournament_id,)
         )
         row = cursor.fetchone()
@@ -460,30 +485,35 @@ async def edit_tournament_form(request: Request, tournament_id: int):
 async def delete_tournament(tournament_id: int):
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
-            # First check if there are any rounds associated with this tournament
-            cursor.execute("SELECT COUNT(*) FROM rounds WHERE tournament_id = ?", (tournament_id,))
-            round_count = cursor.fetchone()[0]
-            
-            if round_count > 0:
-                # If there are rounds, just set the tournament to inactive
-                cursor.execute(
-                    "UPDATE tournaments SET is_active = FALSE WHERE id = ?",
-                    (tournament_id,)
-                )
-            else:
-                # If no rounds, we can safely delete
-                cursor.execute(
-                    "DELETE FROM tournament_results WHERE tournament_id = ?",
-                    (tournament_id,)
-                )
+            # Run the whole check-and-delete in one implicit transaction
+            with conn:
+                cursor = conn.cursor()
+                # EXISTS short-circuits on the first matching round instead
+                # of counting them all
                 cursor.execute(
-                    "DELETE FROM tournaments WHERE id = ?",
+                    "SELECT EXISTS(SELECT 1 FROM rounds WHERE tournament_id = ?)",
                     (tournament_id,)
                 )
-            
-            conn.commit()
-        
+                has_rounds = cursor.fetchone()[0]
+
+                if has_rounds:
+                    # If there are rounds, just set the tournament to inactive
+                    cursor.execute(
+                        "UPDATE tournaments SET is_active = FALSE WHERE id = ?",
+                        (tournament_id,)
+                    )
+                else:
+                    # If no rounds, we can safely delete
+                    cursor.execute(
+                        "DELETE FROM tournament_results WHERE tournament_id = ?",
+                        (tournament_id,)
+                    )
+                    cursor.execute(
+                        "DELETE FROM tournaments WHERE id = ?",
+                        (tournament_id,)
+                    )
+        cache.clear()
+
         return RedirectResponse(url="/admin/tournaments", status_code=303)
     except Exception as e:
         print(f"Error deleting tournament: {e}")
@@ -506,8 +536,7 @@ async def list_trivia_questions(
             cursor = conn.cursor()
             
             # Get categories for filter
-            cursor.execute("SELECT DISTINCT category FROM trivia_questions ORDER BY category")
-            categories = [row[0] for row in cursor.fetchall()]
+            categories = _get_categories(cursor)
             
             # Build query
             query = "SELECT * FROM trivia_questions"
@@ -554,8 +583,7 @@ async def new_trivia_form(request: Request):
     with get_db() as conn:
         cursor = conn.cursor()
         try:
-            cursor.execute("SELECT DISTINCT category FROM trivia_questions ORDER BY category")
-            categories = [row[0] for row in cursor.fetchall()]
+            categories = _get_categories(cursor)
         except sqlite3.OperationalError:
             # If table doesn't exist yet
             categories = ["Movies", "Science", "History", "Geography", "Sports", "Entertainment"]
@@ -592,18 +620,18 @@ async def create_trivia(
                 )
             )
             conn.commit()
-            question_id = cursor.lastrowid
-        
+            _invalidate_categories()
+        cache.clear()
+
         return RedirectResponse(url="/admin/trivia", status_code=303)
     except Exception as e:
         print(f"Error creating trivia question: {e}")
         categories = ["Movies", "Science", "History", "Geography", "Sports", "Entertainment"]
-        
+
         with get_db() as conn:
             try:
                 cursor = conn.cursor()
-                cursor.execute("SELECT DISTINCT category FROM trivia_questions ORDER BY category")
-                categories = [row[0] for row in cursor.fetchall()]
+                categories = _get_categories(cursor)
             except sqlite3.OperationalError:
                 pass
         
@@ -637,7 +665,9 @@ async def delete_trivia_question(question_id: int):
             # Delete the question
             cursor.execute("DELETE FROM trivia_questions WHERE id = ?", (question_id,))
             conn.commit()
-        
+            _invalidate_categories()
+        cache.clear()
+
         return RedirectResponse(url="/admin/trivia", status_code=303)
     except Exception as e:
         print(f"Error deleting trivia question: {e}")
@@ -657,7 +687,8 @@ async def register_all_players():
             # Register all players and update stats
             db = Database(str(db_path))
             results = db.register_players_from_responses()
-            
+            cache.clear()
+
             return {
                 "success": True,
                 "registered": results["registered"],
@@ -682,6 +713,7 @@ async def refresh_player_stats():
             
             # Update all player statistics to ensure consistency
             db._update_all_player_stats(conn)
+            cache.clear()
             
             # Get updated stats
             cursor.execute("""
@@ -1,13 +1,27 @@
-from fastapi import FastAPI, Request, Depends, HTTPException, status
+from fastapi import FastAPI, Request, Response, Depends, HTTPException, status
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.responses import HTMLResponse
+import asyncio
+import hashlib
 import secrets
+import sqlite3
+import threading
 import os
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from jinja2 import FileSystemBytecodeCache
+
+# orjson is optional; fall back to the stdlib encoder when it's missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import json
+
 # Conditionally import routers to prevent errors if they don't exist yet
 try:
     from frontend.admin.routes import admin_router
@@ -21,11 +35,18 @@ try:
 except ImportError:
     public_router_available = False
 
+from frontend import cache
+from frontend.cache import ttl_cache
 from frontend.config import Settings
-from frontend.database import get_db
+from frontend.database import get_db, _CONNECTION_PRAGMAS, _DB_PATH
 
-# Initialize FastAPI app
-app = FastAPI(title="BlueTrivia Admin")
+# Initialize FastAPI app; with orjson installed every JSON endpoint gets
+# the faster encoder without touching the handlers
+if orjson is not None:
+    from fastapi.responses import ORJSONResponse
+    app = FastAPI(title="BlueTrivia Admin", default_response_class=ORJSONResponse)
+else:
+    app = FastAPI(title="BlueTrivia Admin")
 settings = Settings()
 
 # Set up security
@@ -35,16 +56,51 @@ security = HTTPBasic()
 templates_path = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(templates_path))
 
+# The template set doesn't change while the process runs, so probe for the
+# dashboard template once instead of stat()ing it per request
+_HAS_INDEX_TEMPLATE = (templates_path / "index.html").exists()
+
+# Skip the per-render mtime stat and persist compiled templates across
+# restarts; set TEMPLATE_AUTO_RELOAD=1 during development to edit
+# templates without restarting
+if os.environ.get("TEMPLATE_AUTO_RELOAD") != "1":
+    _jinja_cache_dir = os.path.join(tempfile.gettempdir(), "bluetrivia_jinja_cache")
+    os.makedirs(_jinja_cache_dir, exist_ok=True)
+    templates.env.auto_reload = False
+    templates.env.bytecode_cache = FileSystemBytecodeCache(directory=_jinja_cache_dir)
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks assets as long-lived so browsers stop
+    revalidating CSS/JS on every page load. FileResponse already emits a
+    strong ETag from the file's mtime and size, so a changed file still
+    busts the cache after the max-age window."""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 # Mount static files if directory exists
 static_path = Path(__file__).parent / "static"
 if static_path.exists():
-    app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
+    app.mount("/static", CachedStaticFiles(directory=str(static_path)), name="static")
+
+# Settings values used on hot paths, frozen to module constants at import
+# so per-request access skips pydantic's descriptor machinery. Expected
+# credentials are also encoded to bytes once here.
+APP_NAME = settings.app_name
+_USERNAME_B = settings.admin_username.encode()
+_PASSWORD_B = settings.admin_password.encode()
 
 # Authentication middleware
 def verify_admin(credentials: HTTPBasicCredentials = Depends(security)):
-    correct_username = secrets.compare_digest(credentials.username, settings.admin_username)
-    correct_password = secrets.compare_digest(credentials.password, settings.admin_password)
-    if not (correct_username and correct_password):
+    # Combine with & rather than `and` so both comparisons always run,
+    # keeping the check constant-time
+    ok = (
+        secrets.compare_digest(credentials.username.encode(), _USERNAME_B)
+        & secrets.compare_digest(credentials.password.encode(), _PASSWORD_B)
+    )
+    if not ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -52,6 +108,259 @@ def verify_admin(credentials: HTTPBasicCredentials = Depends(security)):
         )
     return credentials.username
 
+_TLS = threading.local()
+
+def _conn():
+    """One persistent SQLite connection per worker thread.
+
+    Opening a fresh connection per helper call pays file locking and
+    page-cache warmup every time; the dashboard helpers run in the
+    threadpool, so a thread-local connection keeps SQLite's page cache
+    warm between renders.
+    """
+    conn = getattr(_TLS, "conn", None)
+    if conn is None:
+        # Path and PRAGMAs are shared with the pool's connection
+        # factory so the two can't drift apart (this helper used to
+        # re-implement the fallback chain with its own PRAGMA subset)
+        conn = sqlite3.connect(
+            _DB_PATH, check_same_thread=False, cached_statements=200
+        )
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_CONNECTION_PRAGMAS)
+        _TLS.conn = conn
+    return conn
+
+def _detect_correct_col():
+    """Find which correctness column player_responses actually has.
+
+    The bot's schema uses is_correct while older frontend migrations added
+    correct; probing once at import lets every query use the real column
+    instead of re-running dual-column fallback queries per request.
+    """
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA table_info(player_responses)")
+            columns = [column[1].lower() for column in cursor.fetchall()]
+            if "is_correct" in columns:
+                return "is_correct"
+            if "correct" in columns:
+                return "correct"
+    except Exception as e:
+        print(f"Error detecting correctness column: {e}")
+    return "is_correct"
+
+_CORRECT_COL = _detect_correct_col()
+
+# SQL for the dashboard helpers, built once at import. Keeping the exact
+# same text per call lets SQLite's per-connection statement cache reuse
+# the prepared plans instead of re-parsing.
+# rounds/player_responses totals come from the trigger-maintained
+# meta_counters rows (O(1) lookups) with a COUNT(*) fallback for databases
+# that predate the counters; players stays a direct COUNT since its rows
+# arrive via trigger where the counter triggers can't fire
+_SQL_STATS = f"""
+    SELECT
+        COALESCE(
+            (SELECT value FROM meta_counters WHERE name = 'rounds'),
+            (SELECT COUNT(*) FROM rounds)
+        ) as total_rounds,
+        (SELECT COUNT(*) FROM players) as total_players,
+        COALESCE(
+            (SELECT value FROM meta_counters WHERE name = 'player_responses'),
+            (SELECT COUNT(*) FROM player_responses)
+        ) as total_answers,
+        (SELECT SUM(CASE WHEN {_CORRECT_COL} = 1 THEN 1 ELSE 0 END)
+         FROM player_responses) as correct_answers
+"""
+
+_SQL_RECENT_WINNERS = f"""
+    SELECT
+        pr.round_id,
+        p.handle,
+        p.display_name,
+        pr.position,
+        r.question_type,
+        (
+            CASE
+                WHEN r.question_type = 'trivia' AND tq.question IS NOT NULL THEN tq.question
+                ELSE NULL
+            END
+        ) as question
+    FROM player_responses pr
+    JOIN players p ON pr.player_id = p.id
+    JOIN rounds r ON pr.round_id = r.id
+    LEFT JOIN trivia_questions tq ON r.question_type = 'trivia' AND r.question_id = tq.id
+    WHERE pr.position = 1 AND pr.{_CORRECT_COL} = 1
+    ORDER BY r.start_time DESC
+    LIMIT ?
+"""
+
+_SQL_CATEGORY_STATS = f"""
+    SELECT
+        CASE
+            WHEN r.question_type = 'movie' THEN 'Movies'
+            WHEN r.question_type = 'trivia' THEN
+                COALESCE((SELECT category FROM trivia_questions WHERE id = r.question_id), 'Trivia')
+            ELSE r.question_type
+        END as name,
+        COUNT(*) as total,
+        SUM(CASE WHEN pr.{_CORRECT_COL} = 1 THEN 1 ELSE 0 END) as correct,
+        CAST(100 * SUM(CASE WHEN pr.{_CORRECT_COL} = 1 THEN 1 ELSE 0 END)
+             / NULLIF(COUNT(*), 0) AS INTEGER) as success_rate
+    FROM player_responses pr
+    JOIN rounds r ON pr.round_id = r.id
+    GROUP BY name
+    ORDER BY total DESC
+"""
+
+_SQL_ACTIVE_TOURNAMENTS = """
+    SELECT
+        t.id,
+        t.name,
+        t.start_date,
+        t.duration_days,
+        t.questions_per_day,
+        (SELECT COUNT(DISTINCT player_id) FROM tournament_results WHERE tournament_id = t.id) as player_count,
+        (SELECT COUNT(*) FROM rounds WHERE tournament_id = t.id) as questions_completed
+    FROM tournaments t
+    WHERE datetime(t.start_date) <= datetime('now')
+      AND datetime(t.start_date, '+' || t.duration_days || ' days') >= datetime('now')
+      AND t.active = 1
+    ORDER BY t.start_date DESC
+"""
+
+_SQL_ANY_ACTIVE_TOURNAMENT = """
+    SELECT
+        t.id,
+        t.name,
+        t.start_date,
+        t.duration_days,
+        t.questions_per_day,
+        (SELECT COUNT(DISTINCT player_id) FROM tournament_results WHERE tournament_id = t.id) as player_count,
+        (SELECT COUNT(*) FROM rounds WHERE tournament_id = t.id) as questions_completed
+    FROM tournaments t
+    WHERE t.active = 1
+    ORDER BY t.start_date DESC
+    LIMIT 1
+"""
+
+_SQL_ANY_TOURNAMENT = """
+    SELECT
+        t.id,
+        t.name,
+        t.start_date,
+        t.duration_days,
+        t.questions_per_day,
+        0 as player_count,
+        0 as questions_completed
+    FROM tournaments t
+    ORDER BY t.start_date DESC
+    LIMIT 1
+"""
+
+_SQL_LEADERBOARD_ALLTIME = f"""
+    SELECT
+        p.id,
+        p.handle,
+        p.display_name,
+        COUNT(pr.id) as attempt_count,
+        SUM(CASE WHEN pr.{_CORRECT_COL} = 1 THEN 1 ELSE 0 END) as correct_count,
+        CAST(100 * SUM(CASE WHEN pr.{_CORRECT_COL} = 1 THEN 1 ELSE 0 END)
+             / NULLIF(COUNT(pr.id), 0) AS INTEGER) as success_rate
+    FROM players p
+    LEFT JOIN player_responses pr ON p.id = pr.player_id
+    GROUP BY p.id
+    HAVING attempt_count > 0
+    ORDER BY correct_count DESC
+    LIMIT 10
+"""
+
+_SQL_LEADERBOARD_TOURNAMENT = """
+    SELECT
+        p.id,
+        p.handle,
+        p.display_name,
+        tr.total_points
+    FROM tournament_results tr
+    JOIN players p ON tr.player_id = p.id
+    JOIN tournaments t ON tr.tournament_id = t.id
+    WHERE t.active = 1
+    ORDER BY tr.total_points DESC
+    LIMIT 10
+"""
+
+_SQL_LEADERBOARD_MONTHLY = f"""
+    SELECT
+        p.id,
+        p.handle,
+        p.display_name,
+        COUNT(pr.id) as attempt_count,
+        SUM(CASE WHEN pr.{_CORRECT_COL} = 1 THEN 1 ELSE 0 END) as correct_count,
+        CAST(100 * SUM(CASE WHEN pr.{_CORRECT_COL} = 1 THEN 1 ELSE 0 END)
+             / NULLIF(COUNT(pr.id), 0) AS INTEGER) as success_rate
+    FROM players p
+    JOIN player_responses pr ON p.id = pr.player_id
+    JOIN rounds r ON pr.round_id = r.id
+    WHERE strftime('%Y-%m', r.start_time) = strftime('%Y-%m', 'now')
+    GROUP BY p.id
+    HAVING attempt_count > 0
+    ORDER BY correct_count DESC
+    LIMIT 10
+"""
+
+def _ensure_indexes():
+    """Create the indexes backing the dashboard/leaderboard aggregations"""
+    statements = (
+        f"CREATE INDEX IF NOT EXISTS idx_pr_player_correct "
+        f"ON player_responses(player_id, {_CORRECT_COL})",
+        "CREATE INDEX IF NOT EXISTS idx_pr_round "
+        "ON player_responses(round_id)",
+        "CREATE INDEX IF NOT EXISTS idx_rounds_tournament "
+        "ON rounds(tournament_id)",
+        "CREATE INDEX IF NOT EXISTS idx_rounds_start_time "
+        "ON rounds(start_time)",
+        # The stats query reads meta_counters (init_db seeds it and
+        # installs the counter triggers); make sure it exists so the
+        # COALESCE fallback works even before init_db has run
+        "CREATE TABLE IF NOT EXISTS meta_counters ("
+        "name TEXT PRIMARY KEY, value INTEGER NOT NULL DEFAULT 0)",
+        # Refresh planner statistics so the new indexes get used
+        "ANALYZE",
+    )
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            # Each statement is guarded on its own: the live bot schema
+            # may lack some columns (e.g. player_responses.player_id),
+            # and one failing CREATE shouldn't skip the rest
+            for statement in statements:
+                try:
+                    cursor.execute(statement)
+                except sqlite3.OperationalError as e:
+                    print(f"Skipping index statement: {e}")
+            conn.commit()
+    except Exception as e:
+        print(f"Error creating indexes: {e}")
+
+
+@app.on_event("startup")
+async def create_indexes():
+    _ensure_indexes()
+
+
+@app.on_event("startup")
+async def warm_connection_pool():
+    # Pre-open the pooled connections the admin/public routers check out
+    # via get_db, so the first requests don't pay connection setup
+    try:
+        from frontend.database import warm_pool
+        warm_pool()
+    except Exception as e:
+        print(f"Error warming connection pool: {e}")
+
+
 # Include routers if available
 if admin_router_available:
     app.include_router(admin_router, prefix="/admin", dependencies=[])  # Removed authentication for testing
@@ -59,431 +368,319 @@ if admin_router_available:
 if public_router_available:
     app.include_router(public_router, prefix="/public")
 
+@ttl_cache("statistics", ttl=30)
 def get_statistics():
     """Get overall game statistics for the dashboard"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        stats = {}
-        
-        # Get total rounds count
-        try:
-            cursor.execute("SELECT COUNT(*) FROM rounds")
-            stats["total_rounds"] = cursor.fetchone()[0] or 0
-        except Exception as e:
-            print(f"Error getting rounds count: {e}")
-            stats["total_rounds"] = 0
-            
-        # Get total players count - FIX: Use players table directly
-        try:
-            cursor.execute("SELECT COUNT(*) FROM players")
-            stats["total_players"] = cursor.fetchone()[0] or 0
-        except Exception as e:
-            print(f"Error getting players count: {e}")
-            stats["total_players"] = 0
-            
-        # Get correct answer ratio - FIX: Use correct column name (is_correct) 
-        try:
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN correct = 1 OR is_correct = 1 THEN 1 ELSE 0 END) as correct
-                FROM player_responses
-            """)
-            result = cursor.fetchone()
-            
-            # If the first query fails, try with the other column name
-            if not result or result["correct"] == 0:
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total,
-                        SUM(CASE WHEN is_correct = 1 THEN 1 ELSE 0 END) as correct
-                    FROM player_responses
-                """)
-                result = cursor.fetchone()
-            
-            total_answers = result["total"] if result else 0
-            correct_answers = result["correct"] if result else 0
+    conn = _conn()
+    cursor = conn.cursor()
+    stats = {
+        "total_rounds": 0,
+        "total_players": 0,
+        "total_answers": 0,
+        "correct_answers": 0,
+        "success_rate": 0
+    }
+
+    # Fetch all the counts in one round-trip: each piece is a scalar
+    # subquery, so a single execute returns everything as one row
+    try:
+        cursor.execute(_SQL_STATS)
+        row = cursor.fetchone()
+
+        if row:
+            stats["total_rounds"] = row["total_rounds"] or 0
+            stats["total_players"] = row["total_players"] or 0
+            total_answers = row["total_answers"] or 0
+            correct_answers = row["correct_answers"] or 0
             stats["total_answers"] = total_answers
             stats["correct_answers"] = correct_answers
             stats["success_rate"] = round((correct_answers / total_answers) * 100) if total_answers > 0 else 0
-        except Exception as e:
-            print(f"Error getting answer statistics: {e}")
-            stats["total_answers"] = 0
-            stats["correct_answers"] = 0
-            stats["success_rate"] = 0
-        
-        return stats
+    except Exception as e:
+        print(f"Error getting statistics: {e}")
+
+    return stats
 
+@ttl_cache("recent_winners", ttl=10)
 def get_recent_winners(limit=2):
     """Get winners from the last few rounds"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        winners = []
-        
-        try:
-            cursor.execute("""
-                SELECT 
-                    pr.round_id,
-                    p.handle,
-                    p.display_name,
-                    pr.position,
-                    r.question_type,
-                    (
-                        CASE 
-                            WHEN r.question_type = 'trivia' AND tq.question IS NOT NULL THEN tq.question
-                            ELSE NULL
-                        END
-                    ) as question
-                FROM player_responses pr
-                JOIN players p ON pr.player_id = p.id
-                JOIN rounds r ON pr.round_id = r.id
-                LEFT JOIN trivia_questions tq ON r.question_type = 'trivia' AND r.question_id = tq.id
-                WHERE pr.position = 1 AND pr.correct = 1
-                ORDER BY r.start_time DESC
-                LIMIT ?
-            """, (limit,))
-            
-            winners = cursor.fetchall()
-        except Exception:
-            pass
-        
-        return winners
+    conn = _conn()
+    cursor = conn.cursor()
+    winners = []
+    
+    try:
+        cursor.execute(_SQL_RECENT_WINNERS, (limit,))
+
+        winners = cursor.fetchall()
+    except Exception:
+        pass
+    
+    return winners
 
+@ttl_cache("category_stats", ttl=120)
 def get_category_stats():
     """Get success rate by category"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        categories = []
-        
-        try:
-            cursor.execute("""
-                SELECT 
-                    CASE
-                        WHEN r.question_type = 'movie' THEN 'Movies'
-                        WHEN r.question_type = 'trivia' THEN 
-                            COALESCE((SELECT category FROM trivia_questions WHERE id = r.question_id), 'Trivia')
-                        ELSE r.question_type
-                    END as name,
-                    COUNT(*) as total,
-                    SUM(CASE WHEN pr.correct = 1 THEN 1 ELSE 0 END) as correct
-                FROM player_responses pr
-                JOIN rounds r ON pr.round_id = r.id
-                GROUP BY name
-                ORDER BY total DESC
-            """)
-            
-            for row in cursor.fetchall():
-                total = row["total"]
-                correct = row["correct"]
-                success_rate = round((correct / total) * 100) if total > 0 else 0
-                categories.append({
-                    "name": row["name"],
-                    "total": total,
-                    "correct": correct,
-                    "success_rate": success_rate
-                })
-        except Exception:
-            pass
-        
-        return categories
+    conn = _conn()
+    cursor = conn.cursor()
+    categories = []
+    
+    try:
+        cursor.execute(_SQL_CATEGORY_STATS)
+
+        for row in cursor.fetchall():
+            categories.append({
+                "name": row["name"],
+                "total": row["total"],
+                "correct": row["correct"],
+                "success_rate": row["success_rate"] or 0
+            })
+    except Exception:
+        pass
+    
+    return categories
 
+@ttl_cache("active_tournaments", ttl=30)
 def get_active_tournaments():
     """Get currently active tournaments with progress info"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        tournaments = []
-        
-        try:
-            # First try with strict date range check
-            cursor.execute("""
-                SELECT 
-                    t.id, 
-                    t.name, 
-                    t.start_date, 
-                    t.duration_days, 
-                    t.questions_per_day,
-                    (SELECT COUNT(DISTINCT player_id) FROM tournament_results WHERE tournament_id = t.id) as player_count,
-                    (SELECT COUNT(*) FROM rounds WHERE tournament_id = t.id) as questions_completed
-                FROM tournaments t
-                WHERE datetime(t.start_date) <= datetime('now') 
-                  AND datetime(t.start_date, '+' || t.duration_days || ' days') >= datetime('now')
-                  AND t.active = 1
-                ORDER BY t.start_date DESC
-            """)
-            
+    conn = _conn()
+    cursor = conn.cursor()
+    tournaments = []
+    
+    try:
+        # First try with strict date range check
+        cursor.execute(_SQL_ACTIVE_TOURNAMENTS)
+
+        rows = cursor.fetchall()
+
+        # If no tournaments found, get any active tournaments or most recent
+        if not rows:
+            cursor.execute(_SQL_ANY_ACTIVE_TOURNAMENT)
             rows = cursor.fetchall()
-            
-            # If no tournaments found, get any active tournaments or most recent
-            if not rows:
-                cursor.execute("""
-                    SELECT 
-                        t.id, 
-                        t.name, 
-                        t.start_date, 
-                        t.duration_days, 
-                        t.questions_per_day,
-                        (SELECT COUNT(DISTINCT player_id) FROM tournament_results WHERE tournament_id = t.id) as player_count,
-                        (SELECT COUNT(*) FROM rounds WHERE tournament_id = t.id) as questions_completed
-                    FROM tournaments t
-                    WHERE t.active = 1
-                    ORDER BY t.start_date DESC
-                    LIMIT 1
-                """)
-                rows = cursor.fetchall()
-            
-            # If still no rows, get any tournament
-            if not rows:
-                cursor.execute("""
-                    SELECT 
-                        t.id, 
-                        t.name, 
-                        t.start_date, 
-                        t.duration_days, 
-                        t.questions_per_day,
-                        0 as player_count,
-                        0 as questions_completed
-                    FROM tournaments t
-                    ORDER BY t.start_date DESC
-                    LIMIT 1
-                """)
-                rows = cursor.fetchall()
-            
-            for row in cursor.fetchall():
-                # Handle the case where duration_days might be NULL or not exist
-                duration_days = row.get("duration_days", 7)
-                if duration_days is None:
-                    duration_days = 7
-                
-                # Handle the case where questions_per_day might be NULL or not exist
-                questions_per_day = row.get("questions_per_day", 4)
-                if questions_per_day is None:
-                    questions_per_day = 4
-                
-                # Parse date safely
-                try:
-                    start_date = datetime.fromisoformat(row["start_date"]) if row["start_date"] else datetime.now()
-                except ValueError:
-                    start_date = datetime.now()
-                    
-                end_date = start_date + timedelta(days=duration_days)
-                days_remaining = (end_date - datetime.now()).days
-                days_remaining = max(0, days_remaining)
-                
-                total_questions = questions_per_day * duration_days
-                questions_completed = row["questions_completed"] or 0
-                progress = round((questions_completed / total_questions) * 100) if total_questions > 0 else 0
-                
-                tournaments.append({
-                    "id": row["id"],
-                    "name": row["name"],
-                    "start_date": row["start_date"],
-                    "days_remaining": days_remaining,
-                    "player_count": row["player_count"] or 0,
-                    "questions_completed": questions_completed,
-                    "total_questions": total_questions,
-                    "progress": progress
-                })
-        except Exception as e:
-            print(f"Error getting active tournaments: {e}")
-            # Return dummy data if there's an error
-            tournaments = [{
-                "id": 1,
-                "name": "Default Tournament",
-                "start_date": datetime.now().isoformat(),
-                "days_remaining": 7,
-                "player_count": 0,
-                "questions_completed": 0,
-                "total_questions": 28,
-                "progress": 0
-            }]
-        
-        return tournaments
 
-def get_leaderboard_data():
-    """Get leaderboard data for all time, tournament, and monthly views"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        results = {
-            "all_time": [],
-            "tournament": [],
-            "monthly": []
-        }
-        
-        # All time leaderboard - FIX: Check both correct and is_correct columns
-        try:
-            cursor.execute("""
-                SELECT 
-                    p.id, 
-                    p.handle, 
-                    p.display_name,
-                    COUNT(pr.id) as attempt_count,
-                    SUM(CASE 
-                        WHEN pr.correct = 1 OR pr.is_correct = 1 THEN 1 
-                        ELSE 0 
-                    END) as correct_count
-                FROM players p
-                LEFT JOIN player_responses pr ON p.id = pr.player_id
-                GROUP BY p.id
-                HAVING attempt_count > 0
-                ORDER BY correct_count DESC
-                LIMIT 10
-            """)
-            
+        # If still no rows, get any tournament
+        if not rows:
+            cursor.execute(_SQL_ANY_TOURNAMENT)
             rows = cursor.fetchall()
+
+        for row in rows:
+            # sqlite3.Row has no .get, so convert once for the defaults below
+            row = dict(row)
+            # Handle the case where duration_days might be NULL or not exist
+            duration_days = row.get("duration_days", 7)
+            if duration_days is None:
+                duration_days = 7
             
-            # If no results, try with just is_correct
-            if not rows or all(row["correct_count"] == 0 for row in rows):
-                cursor.execute("""
-                    SELECT 
-                        p.id, 
-                        p.handle, 
-                        p.display_name,
-                        COUNT(pr.id) as attempt_count,
-                        SUM(CASE WHEN pr.is_correct = 1 THEN 1 ELSE 0 END) as correct_count
-                    FROM players p
-                    LEFT JOIN player_responses pr ON p.id = pr.player_id
-                    GROUP BY p.id
-                    HAVING attempt_count > 0
-                    ORDER BY correct_count DESC
-                    LIMIT 10
-                """)
-                rows = cursor.fetchall()
-            
-            # If still no results, simply get all players
-            if not rows:
-                cursor.execute("""
-                    SELECT 
-                        p.id, 
-                        p.handle, 
-                        p.display_name,
-                        0 as attempt_count,
-                        0 as correct_count
-                    FROM players p
-                    LIMIT 10
-                """)
-                rows = cursor.fetchall()
+            # Handle the case where questions_per_day might be NULL or not exist
+            questions_per_day = row.get("questions_per_day", 4)
+            if questions_per_day is None:
+                questions_per_day = 4
             
-            for row in rows:
-                attempt_count = row["attempt_count"] or 0
-                correct_count = row["correct_count"] or 0
-                success_rate = round((correct_count / attempt_count) * 100) if attempt_count > 0 else 0
+            # Parse date safely
+            try:
+                start_date = datetime.fromisoformat(row["start_date"]) if row["start_date"] else datetime.now()
+            except ValueError:
+                start_date = datetime.now()
                 
-                results["all_time"].append({
-                    "id": row["id"],
-                    "handle": row["handle"],
-                    "display_name": row["display_name"],
-                    "attempt_count": attempt_count,
-                    "correct_count": correct_count,
-                    "success_rate": success_rate
-                })
-        except Exception as e:
-            print(f"Error getting all time leaderboard: {e}")
-        
-        # Tournament leaderboard (active tournaments)
-        try:
-            cursor.execute("""
-                SELECT 
-                    p.id, 
-                    p.handle, 
-                    p.display_name,
-                    tr.total_points
-                FROM tournament_results tr
-                JOIN players p ON tr.player_id = p.id
-                JOIN tournaments t ON tr.tournament_id = t.id
-                WHERE t.active = 1
-                ORDER BY tr.total_points DESC
-                LIMIT 10
-            """)
+            end_date = start_date + timedelta(days=duration_days)
+            days_remaining = (end_date - datetime.now()).days
+            days_remaining = max(0, days_remaining)
             
-            rows = cursor.fetchall()
-            
-            # If no results, get player statistics as an approximation
-            if not rows:
-                cursor.execute("""
-                    SELECT 
-                        p.id, 
-                        p.handle, 
-                        p.display_name,
-                        COUNT(pr.id) as total_points
-                    FROM players p
-                    LEFT JOIN player_responses pr ON p.id = pr.player_id
-                    WHERE pr.correct = 1 OR pr.is_correct = 1
-                    GROUP BY p.id
-                    ORDER BY total_points DESC
-                    LIMIT 10
-                """)
-                rows = cursor.fetchall()
+            total_questions = questions_per_day * duration_days
+            questions_completed = row["questions_completed"] or 0
+            progress = round((questions_completed / total_questions) * 100) if total_questions > 0 else 0
             
+            tournaments.append({
+                "id": row["id"],
+                "name": row["name"],
+                "start_date": row["start_date"],
+                "days_remaining": days_remaining,
+                "player_count": row["player_count"] or 0,
+                "questions_completed": questions_completed,
+                "total_questions": total_questions,
+                "progress": progress
+            })
+    except Exception as e:
+        print(f"Error getting active tournaments: {e}")
+        # Return dummy data if there's an error
+        tournaments = [{
+            "id": 1,
+            "name": "Default Tournament",
+            "start_date": datetime.now().isoformat(),
+            "days_remaining": 7,
+            "player_count": 0,
+            "questions_completed": 0,
+            "total_questions": 28,
+            "progress": 0
+        }]
+    
+    return tournaments
+
+@ttl_cache("leaderboard", ttl=30)
+def get_leaderboard_data():
+    """Get leaderboard data for all time, tournament, and monthly views"""
+    conn = _conn()
+    cursor = conn.cursor()
+    results = {
+        "all_time": [],
+        "tournament": [],
+        "monthly": []
+    }
+    
+    # All time leaderboard
+    try:
+        cursor.execute(_SQL_LEADERBOARD_ALLTIME)
+
+        rows = cursor.fetchall()
+
+        for row in rows:
+            results["all_time"].append({
+                "id": row["id"],
+                "handle": row["handle"],
+                "display_name": row["display_name"],
+                "attempt_count": row["attempt_count"] or 0,
+                "correct_count": row["correct_count"] or 0,
+                "success_rate": row["success_rate"] or 0
+            })
+    except Exception as e:
+        print(f"Error getting all time leaderboard: {e}")
+    
+    # Tournament leaderboard (active tournaments)
+    try:
+        cursor.execute(_SQL_LEADERBOARD_TOURNAMENT)
+
+        rows = cursor.fetchall()
+
+        for row in rows:
+            results["tournament"].append({
+                "id": row["id"],
+                "handle": row["handle"],
+                "display_name": row["display_name"],
+                "total_points": row["total_points"] or 0
+            })
+    except Exception as e:
+        print(f"Error getting tournament leaderboard: {e}")
+    
+    # Monthly leaderboard
+    try:
+        cursor.execute(_SQL_LEADERBOARD_MONTHLY)
+
+        rows = cursor.fetchall()
+
+        if not rows:
+            # Fall back to all-time data if no monthly data
+            results["monthly"] = results["all_time"]
+        else:
             for row in rows:
-                results["tournament"].append({
+                results["monthly"].append({
                     "id": row["id"],
                     "handle": row["handle"],
                     "display_name": row["display_name"],
-                    "total_points": row["total_points"] or 0
+                    "attempt_count": row["attempt_count"] or 0,
+                    "correct_count": row["correct_count"] or 0,
+                    "success_rate": row["success_rate"] or 0
                 })
-        except Exception as e:
-            print(f"Error getting tournament leaderboard: {e}")
-        
-        # Monthly leaderboard
+    except Exception as e:
+        print(f"Error getting monthly leaderboard: {e}")
+        # Use all-time data as fallback
+        results["monthly"] = results["all_time"]
+    
+    return results
+
+# Materialized leaderboard snapshot. A background task recomputes it every
+# _LEADERBOARD_REFRESH seconds (or immediately after an admin mutation via
+# the cache-clear callback), so dashboard requests read from memory no
+# matter how much traffic arrives.
+_LEADERBOARD = {}
+_LEADERBOARD_REFRESH = 30  # seconds
+_leaderboard_refresh_event = asyncio.Event()
+
+async def _refresh_leaderboard_loop(interval):
+    while True:
         try:
-            cursor.execute("""
-                SELECT 
-                    p.id, 
-                    p.handle, 
-                    p.display_name,
-                    COUNT(pr.id) as attempt_count,
-                    SUM(CASE 
-                        WHEN pr.correct = 1 OR pr.is_correct = 1 THEN 1 
-                        ELSE 0 
-                    END) as correct_count
-                FROM players p
-                JOIN player_responses pr ON p.id = pr.player_id
-                JOIN rounds r ON pr.round_id = r.id
-                WHERE strftime('%Y-%m', r.start_time) = strftime('%Y-%m', 'now')
-                GROUP BY p.id
-                HAVING attempt_count > 0
-                ORDER BY correct_count DESC
-                LIMIT 10
-            """)
-            
-            rows = cursor.fetchall()
-            
-            if not rows:
-                # Fall back to all-time data if no monthly data
-                results["monthly"] = results["all_time"]
-            else:
-                for row in rows:
-                    attempt_count = row["attempt_count"] or 0
-                    correct_count = row["correct_count"] or 0
-                    success_rate = round((correct_count / attempt_count) * 100) if attempt_count > 0 else 0
-                    
-                    results["monthly"].append({
-                        "id": row["id"],
-                        "handle": row["handle"],
-                        "display_name": row["display_name"],
-                        "attempt_count": attempt_count,
-                        "correct_count": correct_count,
-                        "success_rate": success_rate
-                    })
+            # Call the undecorated helper so the refresh bypasses the TTL
+            # cache and always sees fresh data
+            data = await asyncio.to_thread(get_leaderboard_data.__wrapped__)
+            _LEADERBOARD.clear()
+            _LEADERBOARD.update(data)
         except Exception as e:
-            print(f"Error getting monthly leaderboard: {e}")
-            # Use all-time data as fallback
-            results["monthly"] = results["all_time"]
-        
-        return results
+            print(f"Error refreshing leaderboard: {e}")
+
+        _leaderboard_refresh_event.clear()
+        try:
+            await asyncio.wait_for(_leaderboard_refresh_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+@app.on_event("startup")
+async def start_leaderboard_refresh():
+    cache.on_clear(_leaderboard_refresh_event.set)
+    asyncio.create_task(_refresh_leaderboard_loop(_LEADERBOARD_REFRESH))
+
+
+# Fallback page for when the dashboard can't render; built and encoded
+# once at import so the error path doesn't re-allocate it per request
+_FALLBACK_HTML = """
+<!DOCTYPE html>
+<html>
+    <head>
+        <title>BlueTrivia</title>
+        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
+        <style>
+            body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
+            h1 { color: #0066cc; }
+            .container { max-width: 800px; margin: 0 auto; }
+            .card { border: 1px solid #ddd; border-radius: 8px; padding: 20px; margin-bottom: 20px; }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <h1>Welcome to BlueTrivia</h1>
+            <div class="card">
+                <h2>Navigation</h2>
+                <p><a href="/admin">Admin Interface</a></p>
+            </div>
+            <div class="card">
+                <h2>Error Loading Dashboard</h2>
+                <p>There was an error loading the dashboard statistics. This might happen if the database is not yet fully set up.</p>
+                <p>You can continue to the admin interface using the link above.</p>
+            </div>
+        </div>
+    </body>
+</html>
+""".encode("utf-8")
+
+_FALLBACK_RESPONSE = HTMLResponse(content=_FALLBACK_HTML)
+
 
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
+    if not _HAS_INDEX_TEMPLATE:
+        return _FALLBACK_RESPONSE
+
     try:
-        # Get all statistics for the dashboard
-        stats = get_statistics()
-        recent_winners = get_recent_winners(limit=2)
-        category_stats = get_category_stats()
-        active_tournaments = get_active_tournaments()
-        leaderboard_data = get_leaderboard_data()
-        
-        return templates.TemplateResponse("index.html", {
-            "request": request, 
+        # Get all statistics for the dashboard; each helper opens its own
+        # connection, so run them in the threadpool and overlap the queries
+        # instead of serializing them on the event loop
+        (
+            stats,
+            recent_winners,
+            category_stats,
+            active_tournaments,
+        ) = await asyncio.gather(
+            cache.single_flight("statistics", get_statistics),
+            cache.single_flight("recent_winners", get_recent_winners, 2),
+            cache.single_flight("category_stats", get_category_stats),
+            cache.single_flight("active_tournaments", get_active_tournaments),
+        )
+
+        # The background task keeps the leaderboard snapshot current; only
+        # compute inline before its first pass has landed
+        leaderboard_data = _LEADERBOARD or await cache.single_flight(
+            "leaderboard", get_leaderboard_data
+        )
+
+        response = templates.TemplateResponse("index.html", {
+            "request": request,
             "title": "BlueTrivia",
             "stats": stats,
             "recent_winners": recent_winners,
@@ -493,44 +690,44 @@ async def root(request: Request):
             "tournament_leaders": leaderboard_data["tournament"],
             "monthly_leaders": leaderboard_data["monthly"]
         })
+
+        # The page only changes when the cached stats refresh, so hand
+        # returning clients a 304 instead of re-sending the full body
+        etag = hashlib.blake2b(response.body, digest_size=8).hexdigest()
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, max-age=30"
+        return response
     except Exception as e:
         # If there's an error rendering the statistics, provide a simple page
         print(f"Error rendering dashboard: {e}")
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-            <head>
-                <title>BlueTrivia</title>
-                <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-                <style>
-                    body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
-                    h1 { color: #0066cc; }
-                    .container { max-width: 800px; margin: 0 auto; }
-                    .card { border: 1px solid #ddd; border-radius: 8px; padding: 20px; margin-bottom: 20px; }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <h1>Welcome to BlueTrivia</h1>
-                    <div class="card">
-                        <h2>Navigation</h2>
-                        <p><a href="/admin">Admin Interface</a></p>
-                    </div>
-                    <div class="card">
-                        <h2>Error Loading Dashboard</h2>
-                        <p>There was an error loading the dashboard statistics. This might happen if the database is not yet fully set up.</p>
-                        <p>You can continue to the admin interface using the link above.</p>
-                    </div>
-                </div>
-            </body>
-        </html>
-        """
-        return HTMLResponse(content=html_content)
+        return _FALLBACK_RESPONSE
+
+# Liveness probes can hit /health once a second per replica, so serialize
+# the (static) payload once instead of per request
+if orjson is not None:
+    _HEALTH_BODY = orjson.dumps({"status": "ok", "app_name": APP_NAME})
+else:
+    _HEALTH_BODY = json.dumps({"status": "ok", "app_name": APP_NAME}).encode()
+
+_HEALTH_RESPONSE = Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "ok", "app_name": settings.app_name}
+    return _HEALTH_RESPONSE
+
+def create_app():
+    """App factory for uvicorn's factory=True target.
+
+    The application is assembled once at module import (routes, startup
+    hooks, caches), so the factory just hands back that instance; it
+    exists so launchers can point at frontend.app:create_app and defer
+    the import of this module until the server actually starts.
+    """
+    return app
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,63 @@
+"""Small in-memory TTL cache for the dashboard queries.
+
+The dashboard aggregations over player_responses/rounds change on a
+seconds-to-minutes scale, so recomputing them for every page load just
+burns SQLite time. Helpers wrapped with ttl_cache serve repeat requests
+from memory until their entry expires; admin mutation routes call
+clear() so fresh data shows up right away after an edit.
+"""
+import asyncio
+import functools
+import time
+from collections import defaultdict
+
+# name -> (expiry, value)
+_cache = {}
+
+# per-key locks for single-flight refreshes
+_locks = defaultdict(asyncio.Lock)
+
+
+def ttl_cache(name, ttl):
+    """Cache a zero/few-arg helper's result for ttl seconds"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args):
+            key = (name,) + args
+            entry = _cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            value = fn(*args)
+            _cache[key] = (time.monotonic() + ttl, value)
+            return value
+        return wrapper
+    return decorator
+
+
+async def single_flight(name, fn, *args):
+    """Run a ttl_cache-wrapped helper in the threadpool, one caller at a time.
+
+    When an entry expires, every concurrent dashboard load would otherwise
+    dispatch its own recompute and stampede the database. Serializing per
+    key means the first caller does the work and the rest hit the freshly
+    written cache entry as soon as the lock frees up.
+    """
+    async with _locks[name]:
+        return await asyncio.to_thread(fn, *args)
+
+
+# Callbacks to run whenever the cache is cleared, e.g. to kick off an
+# immediate background refresh of materialized data
+_clear_callbacks = []
+
+
+def on_clear(fn):
+    """Register a callback to run after every clear()"""
+    _clear_callbacks.append(fn)
+
+
+def clear():
+    """Drop all cached dashboard data (called after admin mutations)"""
+    _cache.clear()
+    for fn in _clear_callbacks:
+        fn()
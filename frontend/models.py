@@ -1,10 +1,36 @@
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, Optional
+import functools
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_distribution(value) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_distribution(raw: str):
+    # Only a handful of distinct distribution strings exist across
+    # tournaments, so memoizing the parse skips the JSON work on almost
+    # every row (pydantic copies the dict during validation, so sharing
+    # the cached value is safe).
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class Tournament(BaseModel):
+    # from_attributes lets model_validate hydrate straight from row
+    # objects without an intermediate dict copy per row
+    model_config = ConfigDict(from_attributes=True)
+
     id: Optional[int] = None
     name: str
     start_time: int
@@ -25,7 +51,7 @@ class Tournament(BaseModel):
             "end_time": self.end_time,
             "duration_days": self.duration_days,
             "questions_per_day": self.questions_per_day,
-            "source_distribution": json.dumps(self.source_distribution),
+            "source_distribution": _dump_distribution(self.source_distribution),
             "bonus_first": self.bonus_first,
             "bonus_second": self.bonus_second,
             "bonus_third": self.bonus_third,
@@ -35,23 +61,14 @@ class Tournament(BaseModel):
     
     @classmethod
     def from_db_row(cls, row):
-        return cls(
-            id=row["id"],
-            name=row["name"],
-            start_time=row["start_time"],
-            end_time=row["end_time"],
-            duration_days=row["duration_days"],
-            questions_per_day=row["questions_per_day"],
-            source_distribution=json.loads(row["source_distribution"]),
-            bonus_first=row["bonus_first"],
-            bonus_second=row["bonus_second"],
-            bonus_third=row["bonus_third"],
-            is_active=bool(row["is_active"]),
-            total_rounds=row["total_rounds"]
-        )
+        data = dict(row)
+        data["source_distribution"] = _load_distribution(data["source_distribution"])
+        return cls.model_validate(data)
 
 
 class TriviaQuestion(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: Optional[int] = None
     category: str
     question: str
@@ -70,6 +87,8 @@ class TriviaQuestion(BaseModel):
 
 
 class Player(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: Optional[int] = None
     handle: str
     display_name: Optional[str] = None
@@ -86,6 +105,8 @@ class Player(BaseModel):
 
 
 class RoundResult(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: Optional[int] = None
     round_id: int
     player_id: int
@@ -95,6 +116,8 @@ class RoundResult(BaseModel):
 
 
 class TournamentResult(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     tournament_id: int
     player_id: int
     total_points: int = 0
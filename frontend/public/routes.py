@@ -1,97 +1,498 @@
 from fastapi import APIRouter, Request, Depends, Query, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 from typing import List, Optional
+from collections import OrderedDict
 from pathlib import Path
+from types import SimpleNamespace
+import asyncio
+import sqlite3
+import base64
+import functools
+import hashlib
+import json
+import os
+import tempfile
 
-from frontend.database import get_db
-from frontend.models import Player, Tournament
+from jinja2 import FileSystemBytecodeCache
+
+from frontend.cache import on_clear, ttl_cache
+from frontend.database import get_db, db_version, query_budget
+from frontend.models import _load_distribution
 
 public_router = APIRouter()
 templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
 
+# Same template tuning as app.py: compile each template once per
+# machine via the shared bytecode cache and skip the per-render mtime
+# stat, unless template editing is explicitly enabled. Rendering stays
+# synchronous - Jinja's async mode adds an isawaitable check per call.
+if os.environ.get("TEMPLATE_AUTO_RELOAD") != "1":
+    _jinja_cache_dir = os.path.join(tempfile.gettempdir(), "bluetrivia_jinja_cache")
+    os.makedirs(_jinja_cache_dir, exist_ok=True)
+    templates.env.auto_reload = False
+    templates.env.bytecode_cache = FileSystemBytecodeCache(directory=_jinja_cache_dir)
+
+# SQL for the routes below lives in module constants: sqlite3 keys its
+# per-connection prepared-statement cache on the exact statement text,
+# so constant strings guarantee cache hits across requests on the
+# pooled connections.
+
+_SQL_ACTIVE_TOURNAMENTS = """
+    SELECT * FROM tournaments
+    WHERE start_date <= datetime('now')
+    AND end_date >= datetime('now')
+    ORDER BY start_date DESC
+"""
+
+_SQL_TOURNAMENT_BY_ID = "SELECT * FROM tournaments WHERE id = ?"
+
+# The leaderboard queries stay inside their covering indexes: player
+# identity is resolved afterwards with an IN-list point lookup (see
+# _player_identities) instead of a JOIN, so SQLite never leaves the
+# index to walk players per row.
+_SQL_TOURNAMENT_LEADERBOARD = """
+    SELECT player_id, total_points, final_position, bonus_points
+    FROM tournament_results
+    WHERE tournament_id = ?
+      AND (? IS NULL OR (total_points, player_id) < (?, ?))
+    ORDER BY total_points DESC, player_id DESC
+    LIMIT ?
+"""
+
+_SQL_GLOBAL_LEADERBOARD = """
+    SELECT player_id, correct_count, total_attempts, total_points
+    FROM player_totals
+    WHERE (? IS NULL OR (total_points, player_id) < (?, ?))
+    ORDER BY total_points DESC, player_id DESC
+    LIMIT ?
+"""
+
+_SQL_PLAYER_BY_HANDLE = "SELECT * FROM players WHERE handle = ?"
+
+# Everything else the profile page needs comes back in one statement:
+# each section is a subselect folded into JSON (json_group_array keeps
+# the inner ORDER BY), so one round-trip replaces four. ?1 is the
+# player id throughout. The trivia category uses a LEFT JOIN instead of
+# a correlated subquery SQLite would re-run per grouped row.
+_SQL_PLAYER_PROFILE = """
+    SELECT
+        (SELECT json_object(
+            'correct_count', COALESCE(SUM(pr.correct), 0),
+            'total_attempts', COUNT(pr.id),
+            'total_rounds', (SELECT COUNT(DISTINCT r.id) FROM rounds r),
+            'participated_rounds', (SELECT COUNT(DISTINCT r.id)
+                                    FROM rounds r
+                                    JOIN player_responses p ON r.id = p.round_id
+                                    WHERE p.player_id = ?1))
+         FROM player_responses pr
+         WHERE pr.player_id = ?1) as stats_json,
+        (SELECT json_group_array(json_object(
+            'tournament_id', tournament_id, 'name', name,
+            'total_points', total_points, 'final_position', final_position,
+            'bonus_points', bonus_points))
+         FROM (SELECT tr.tournament_id, t.name, tr.total_points,
+                      tr.final_position, tr.bonus_points
+               FROM tournament_results tr
+               JOIN tournaments t ON tr.tournament_id = t.id
+               WHERE tr.player_id = ?1
+               ORDER BY t.start_date DESC)) as tournaments_json,
+        (SELECT json_group_array(json_object(
+            'id', id, 'start_time', start_time, 'question_type', question_type,
+            'correct', correct, 'position', position))
+         FROM (SELECT r.id, r.start_time, r.question_type, pr.correct, pr.position
+               FROM player_responses pr
+               JOIN rounds r ON pr.round_id = r.id
+               WHERE pr.player_id = ?1
+               ORDER BY r.start_time DESC
+               LIMIT 10)) as recent_games_json,
+        (SELECT json_group_array(json_object(
+            'category', category, 'attempts', attempts, 'correct', correct))
+         FROM (SELECT
+                   CASE
+                       WHEN r.question_type = 'movie' THEN 'Movies'
+                       WHEN r.question_type = 'trivia' THEN tq.category
+                       ELSE r.question_type
+                   END as category,
+                   COUNT(pr.id) as attempts,
+                   COALESCE(SUM(pr.correct), 0) as correct
+               FROM player_responses pr
+               JOIN rounds r ON pr.round_id = r.id
+               LEFT JOIN trivia_questions tq
+                   ON r.question_type = 'trivia' AND tq.id = r.question_id
+               WHERE pr.player_id = ?1
+               GROUP BY category
+               ORDER BY attempts DESC)) as categories_json
+"""
+
+# player_count comes from a correlated subquery rather than a
+# LEFT JOIN + GROUP BY: the join visited every result row of every
+# tournament per page load, while the subquery is one range probe of
+# the (tournament_id, ...) results index per listed tournament.
+_SQL_TOURNAMENT_LIST = """
+    SELECT t.*,
+           (SELECT COUNT(DISTINCT player_id)
+            FROM tournament_results
+            WHERE tournament_id = t.id) as player_count,
+           (t.end_date < datetime('now')) as is_completed
+    FROM tournaments t
+    ORDER BY
+        CASE
+            WHEN t.start_date <= datetime('now') AND
+                 t.end_date >= datetime('now')
+            THEN 0
+            WHEN t.start_date > datetime('now')
+            THEN 1
+            ELSE 2
+        END,
+        t.start_date DESC
+"""
+
+_SQL_TOURNAMENT_TOP_PLAYERS = """
+    SELECT tr.player_id, p.handle, p.display_name,
+           tr.total_points, tr.final_position, tr.bonus_points
+    FROM tournament_results tr
+    JOIN players p ON tr.player_id = p.id
+    WHERE tr.tournament_id = ?
+    ORDER BY tr.final_position IS NULL, tr.final_position ASC, tr.total_points DESC
+    LIMIT 10
+"""
+
+_SQL_TOURNAMENT_ROUNDS = """
+    SELECT r.id, r.start_time, r.question_type,
+           COUNT(pr.id) as response_count,
+           COALESCE(SUM(pr.correct), 0) as correct_count
+    FROM rounds r
+    LEFT JOIN player_responses pr ON r.id = pr.round_id
+    WHERE r.tournament_id = ?
+    GROUP BY r.id
+    ORDER BY r.start_time DESC
+    LIMIT 20
+"""
+
+# One pass over the tournament's responses instead of the old
+# rounds LEFT JOIN: total_rounds comes from the tiny r CTE (an index
+# range on tournament_id), which drops one of the two COUNT(DISTINCT)
+# hash sets, and AVG over the 0/1 correct column gives the success rate
+# without a second conditional sum.
+_SQL_TOURNAMENT_STATS = """
+    WITH r AS (
+        SELECT id FROM rounds WHERE tournament_id = ?
+    ),
+    pr AS (
+        SELECT player_id, correct FROM player_responses
+        WHERE round_id IN (SELECT id FROM r)
+    )
+    SELECT
+        COUNT(DISTINCT player_id) as total_players,
+        (SELECT COUNT(*) FROM r) as total_rounds,
+        COALESCE(SUM(correct), 0) as total_correct,
+        COUNT(*) as total_responses,
+        CASE
+            WHEN COUNT(*) > 0
+            THEN ROUND(AVG(correct) * 100, 1)
+            ELSE 0
+        END as success_rate
+    FROM pr
+"""
+
+# The four home-page result sets ship in one statement: each CTE tags
+# its rows with a kind and a ROW_NUMBER so the single outer ORDER BY
+# keeps every section in its own display order, and the payload rides
+# as json_object. One VDBE entry instead of four.
+_SQL_HOME_COMBINED = """
+    WITH stats AS (
+        SELECT
+            COUNT(DISTINCT r.id) as total_rounds,
+            COUNT(DISTINCT pr.player_id) as total_players,
+            COALESCE(SUM(pr.correct), 0) as total_correct,
+            COUNT(pr.id) as total_responses,
+            CASE
+                WHEN COUNT(pr.id) > 0
+                THEN ROUND(AVG(pr.correct) * 100, 1)
+                ELSE 0
+            END as success_rate
+        FROM rounds r
+        LEFT JOIN player_responses pr ON r.id = pr.round_id
+    ),
+    top AS (
+        SELECT p.id, p.handle, p.display_name,
+               pt.correct_count, pt.total_attempts, pt.total_points,
+               ROW_NUMBER() OVER (ORDER BY pt.total_points DESC) as rn
+        FROM player_totals pt
+        JOIN players p ON p.id = pt.player_id
+        WHERE pt.total_attempts > 0
+        ORDER BY pt.total_points DESC
+        LIMIT 5
+    ),
+    active AS (
+        SELECT t.id, t.name, t.start_date, t.duration_days,
+               COUNT(DISTINCT tr.player_id) as player_count,
+               ROW_NUMBER() OVER (ORDER BY t.start_date ASC) as rn
+        FROM tournaments t
+        LEFT JOIN tournament_results tr ON t.id = tr.tournament_id
+        WHERE t.start_date <= datetime('now')
+        AND t.end_date >= datetime('now')
+        GROUP BY t.id
+        ORDER BY t.start_date ASC
+        LIMIT 3
+    ),
+    recent AS (
+        SELECT r.id, r.start_time, r.question_type,
+               COUNT(pr.id) as response_count,
+               COALESCE(SUM(pr.correct), 0) as correct_count,
+               ROW_NUMBER() OVER (ORDER BY r.start_time DESC) as rn
+        FROM rounds r
+        LEFT JOIN player_responses pr ON r.id = pr.round_id
+        GROUP BY r.id
+        ORDER BY r.start_time DESC
+        LIMIT 5
+    )
+    SELECT 'stats' as kind, 0 as rn, json_object(
+        'total_rounds', total_rounds, 'total_players', total_players,
+        'total_correct', total_correct, 'total_responses', total_responses,
+        'success_rate', success_rate) as payload
+    FROM stats
+    UNION ALL
+    SELECT 'top', rn, json_object(
+        'id', id, 'handle', handle, 'display_name', display_name,
+        'correct_count', correct_count, 'total_attempts', total_attempts,
+        'total_points', total_points)
+    FROM top
+    UNION ALL
+    SELECT 'active', rn, json_object(
+        'id', id, 'name', name, 'start_date', start_date,
+        'duration_days', duration_days, 'player_count', player_count)
+    FROM active
+    UNION ALL
+    SELECT 'recent', rn, json_object(
+        'id', id, 'start_time', start_time, 'question_type', question_type,
+        'response_count', response_count, 'correct_count', correct_count)
+    FROM recent
+    ORDER BY kind, rn
+"""
+
+
+# Rendered-page cache: every anonymous visitor gets identical HTML
+# between writes, so re-querying and re-rendering per request is pure
+# waste. Entries are keyed on (path, query, db_version) - db_version
+# changes on any commit, including the bot's, so stale pages simply
+# stop being addressable and age out of the LRU.
+_PAGE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_PAGE_CACHE_MAX = 256
+
+
+def _cached_page(handler):
+    """Serve a GET handler's rendered HTML from the page cache"""
+    @functools.wraps(handler)
+    async def wrapper(*args, **kwargs):
+        request = kwargs.get("request") or next(
+            a for a in args if isinstance(a, Request)
+        )
+        key = (request.url.path, str(request.query_params), db_version())
+        cached = _PAGE_CACHE.get(key)
+        if cached is not None:
+            etag, body = cached
+            _PAGE_CACHE.move_to_end(key)
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304)
+            return HTMLResponse(content=body, headers={"ETag": etag})
+
+        response = await handler(*args, **kwargs)
+        if response.status_code == 200:
+            etag = hashlib.blake2b(response.body, digest_size=8).hexdigest()
+            response.headers["ETag"] = etag
+            _PAGE_CACHE[key] = (etag, response.body)
+            while len(_PAGE_CACHE) > _PAGE_CACHE_MAX:
+                _PAGE_CACHE.popitem(last=False)
+        return response
+    return wrapper
+
+
+# The running-window predicate can't back a partial index (SQLite
+# forbids datetime('now') there), but the active set only changes on
+# minute granularity, so a short TTL cache removes the per-request
+# tournaments scan from the leaderboard entirely. Tournament models are
+# immutable enough in practice to share across requests. The key is
+# namespaced: the dashboard's get_active_tournaments caches a different
+# shape under "active_tournaments" in the same module-global cache.
+@ttl_cache("public_active_tournaments", 60)
+def _active_tournaments():
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_ACTIVE_TOURNAMENTS)
+        return [_tournament_view(t) for t in cursor.fetchall()]
+
+
+# Cross-request cache of player identity (handle/display_name): the
+# leaderboard pages only ever need these two fields per id, they change
+# rarely, and admin mutations already call cache.clear(), which empties
+# this via the on_clear hook.
+_IDENTITY_CACHE_MAX = 1024
+_identity_cache: "OrderedDict[int, tuple]" = OrderedDict()
+on_clear(_identity_cache.clear)
+
+
+def _player_identities(cursor, player_ids):
+    """Resolve player ids to (handle, display_name) tuples.
+
+    Uncached ids are fetched in one IN-list query - a single index seek
+    per id, with no join-ordering work - and remembered for later pages.
+    The IN list length only varies with the page size, so the handful of
+    distinct statement texts still fit the prepared-statement cache.
+    """
+    missing = [pid for pid in player_ids if pid not in _identity_cache]
+    if missing:
+        placeholders = ", ".join("?" * len(missing))
+        cursor.execute(
+            f"SELECT id, handle, display_name FROM players WHERE id IN ({placeholders})",
+            missing
+        )
+        for row in cursor.fetchall():
+            _identity_cache[row["id"]] = (row["handle"], row["display_name"])
+        while len(_identity_cache) > _IDENTITY_CACHE_MAX:
+            _identity_cache.popitem(last=False)
+    return {
+        pid: _identity_cache.get(pid, (None, None)) for pid in player_ids
+    }
+
+
+def _merge_identities(cursor, result_rows):
+    """Attach handle/display_name to leaderboard rows, Python-side"""
+    identities = _player_identities(
+        cursor, [row["player_id"] for row in result_rows]
+    )
+    merged = []
+    for row in result_rows:
+        entry = dict(row)
+        entry["handle"], entry["display_name"] = identities[entry["player_id"]]
+        merged.append(entry)
+    return merged
+
+
+def _tournament_view(row):
+    """Template-facing tournament object from a raw database row.
+
+    The read-only pages only ever read attributes off the tournament, so
+    a SimpleNamespace skips the per-request pydantic validation pass -
+    the Tournament model stays for code paths that actually validate.
+    """
+    data = dict(row)
+    raw = data.get("source_distribution")
+    if isinstance(raw, str):
+        data["source_distribution"] = _load_distribution(raw)
+    return SimpleNamespace(**data)
+
+
+def _decode_cursor(cursor: Optional[str]):
+    """Decode a keyset pagination cursor into (points, player_id)"""
+    if not cursor:
+        return None
+    try:
+        points, player_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        return int(points), int(player_id)
+    except Exception:
+        return None  # bad cursor: just serve the first page
+
+
+def _encode_cursor(points: int, player_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{points}:{player_id}".encode()).decode()
+
+
+# The handlers below are async (FastAPI runs them on the event loop)
+# but all their real work - sqlite3 queries and the Jinja render inside
+# TemplateResponse - is blocking, so each one pushes its synchronous
+# _*_page body onto the default thread pool with asyncio.to_thread.
+# A slow query then stalls one worker thread, not every request.
+
 @public_router.get("/leaderboard", response_class=HTMLResponse)
+@_cached_page
 async def global_leaderboard(
     request: Request,
     tournament_id: Optional[int] = None,
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = None,
     page_size: int = Query(25, ge=1, le=100)
 ):
+    # Keyset pagination: OFFSET forces SQLite to materialize and discard
+    # every preceding row, so deep pages got slower and slower. The
+    # cursor carries the last row's (points, player_id) and the query
+    # seeks straight to the next page.
+    last_seen = _decode_cursor(cursor)
+
+    return await asyncio.to_thread(
+        _global_leaderboard_page, request, tournament_id, last_seen, page_size
+    )
+
+def _global_leaderboard_page(request, tournament_id, last_seen, page_size):
+    # Active tournaments for the selector come from the TTL cache
+    active_tournaments = _active_tournaments()
+
     with get_db() as conn:
-        cursor = conn.cursor()
-        
-        # Get active tournaments for selector
-        cursor.execute(
-            """
-            SELECT * FROM tournaments 
-            WHERE datetime(start_date) <= datetime('now') 
-            AND datetime(start_date, '+' || duration_days || ' days') >= datetime('now')
-            ORDER BY start_date DESC
-            """
-        )
-        tournaments_data = cursor.fetchall()
-        active_tournaments = [Tournament.from_db_row(dict(t)) for t in tournaments_data]
-        
+        db_cursor = conn.cursor()
+
         if tournament_id:
             # Tournament specific leaderboard
-            cursor.execute("SELECT * FROM tournaments WHERE id = ?", (tournament_id,))
-            tournament_row = cursor.fetchone()
+            db_cursor.execute(_SQL_TOURNAMENT_BY_ID, (tournament_id,))
+            tournament_row = db_cursor.fetchone()
             if not tournament_row:
                 raise HTTPException(status_code=404, detail="Tournament not found")
-            
-            tournament = Tournament.from_db_row(dict(tournament_row))
-            
-            # Get total players count
-            cursor.execute(
-                "SELECT COUNT(*) FROM tournament_results WHERE tournament_id = ?", 
-                (tournament_id,)
-            )
-            total_count = cursor.fetchone()[0]
-            
-            # Get player results for this tournament with pagination
-            cursor.execute(
-                """
-                SELECT tr.player_id, p.handle, p.display_name, 
-                       tr.total_points, tr.final_position, tr.bonus_points
-                FROM tournament_results tr
-                JOIN players p ON tr.player_id = p.id
-                WHERE tr.tournament_id = ?
-                ORDER BY tr.total_points DESC
-                LIMIT ? OFFSET ?
-                """,
-                (tournament_id, page_size, (page - 1) * page_size)
-            )
-            leaderboard_data = cursor.fetchall()
-            
+
+            tournament = _tournament_view(tournament_row)
+
+            # Get player results for this tournament, seeking past the
+            # cursor position instead of OFFSET-scanning; the opcode
+            # budget turns a crafted runaway request into a clean 400
+            try:
+                with query_budget(conn):
+                    db_cursor.execute(
+                        _SQL_TOURNAMENT_LEADERBOARD,
+                        (
+                            tournament_id,
+                            last_seen and 1,
+                            last_seen[0] if last_seen else 0,
+                            last_seen[1] if last_seen else 0,
+                            page_size,
+                        )
+                    )
+                    leaderboard_data = _merge_identities(
+                        db_cursor, db_cursor.fetchall()
+                    )
+            except sqlite3.OperationalError:
+                raise HTTPException(status_code=400, detail="Query too broad")
+
             title = f"Tournament: {tournament.name}"
-            
+
         else:
-            # Global all-time leaderboard
-            cursor.execute("SELECT COUNT(*) FROM players")
-            total_count = cursor.fetchone()[0]
-            
-            cursor.execute(
-                """
-                SELECT p.id, p.handle, p.display_name,
-                    COUNT(CASE WHEN r.correct = 1 THEN 1 END) as correct_count,
-                    COUNT(r.id) as total_attempts,
-                    SUM(rr.points_earned) as total_points
-                FROM players p
-                LEFT JOIN player_responses r ON p.id = r.player_id
-                LEFT JOIN round_results rr ON p.id = rr.player_id
-                GROUP BY p.id, p.handle, p.display_name
-                ORDER BY total_points DESC, correct_count DESC
-                LIMIT ? OFFSET ?
-                """,
-                (page_size, (page - 1) * page_size)
-            )
-            leaderboard_data = cursor.fetchall()
-            
+            # Global all-time leaderboard from the materialized
+            # player_totals table (kept current by triggers), seeking
+            # past the cursor position on its covering index
+            try:
+                with query_budget(conn):
+                    db_cursor.execute(
+                        _SQL_GLOBAL_LEADERBOARD,
+                        (
+                            last_seen and 1,
+                            last_seen[0] if last_seen else 0,
+                            last_seen[1] if last_seen else 0,
+                            page_size,
+                        )
+                    )
+                    leaderboard_data = _merge_identities(
+                        db_cursor, db_cursor.fetchall()
+                    )
+            except sqlite3.OperationalError:
+                raise HTTPException(status_code=400, detail="Query too broad")
+
             tournament = None
             title = "Global Leaderboard"
-    
-    total_pages = (total_count + page_size - 1) // page_size
-    
+
+    next_cursor = None
+    if len(leaderboard_data) == page_size:
+        last_row = leaderboard_data[-1]
+        next_cursor = _encode_cursor(
+            last_row["total_points"] or 0, last_row["player_id"]
+        )
+
     return templates.TemplateResponse(
         "public/leaderboard.html",
         {
@@ -100,91 +501,39 @@ async def global_leaderboard(
             "title": title,
             "tournament": tournament,
             "active_tournaments": active_tournaments,
-            "page": page,
-            "total_pages": total_pages
+            "next_cursor": next_cursor
         }
     )
 
 @public_router.get("/players/{handle}", response_class=HTMLResponse)
+@_cached_page
 async def player_profile(request: Request, handle: str):
+    return await asyncio.to_thread(_player_profile_page, request, handle)
+
+def _player_profile_page(request, handle):
     with get_db() as conn:
         cursor = conn.cursor()
-        
+
         # Get player details
-        cursor.execute("SELECT * FROM players WHERE handle = ?", (handle,))
+        cursor.execute(_SQL_PLAYER_BY_HANDLE, (handle,))
         player_row = cursor.fetchone()
         if not player_row:
             raise HTTPException(status_code=404, detail="Player not found")
-        
-        player = Player(**dict(player_row))
-        
-        # Get player statistics
-        cursor.execute(
-            """
-            SELECT 
-                COUNT(CASE WHEN pr.correct = 1 THEN 1 END) as correct_count,
-                COUNT(pr.id) as total_attempts,
-                (SELECT COUNT(DISTINCT r.id) FROM rounds r) as total_rounds,
-                (SELECT COUNT(DISTINCT r.id) 
-                 FROM rounds r 
-                 JOIN player_responses p ON r.id = p.round_id 
-                 WHERE p.player_id = ?) as participated_rounds
-            FROM player_responses pr
-            WHERE pr.player_id = ?
-            """,
-            (player.id, player.id)
-        )
-        stats = dict(cursor.fetchone())
-        
-        # Get player tournament history
-        cursor.execute(
-            """
-            SELECT tr.tournament_id, t.name, tr.total_points, tr.final_position, tr.bonus_points
-            FROM tournament_results tr
-            JOIN tournaments t ON tr.tournament_id = t.id
-            WHERE tr.player_id = ?
-            ORDER BY t.start_date DESC
-            """,
-            (player.id,)
-        )
-        tournaments = cursor.fetchall()
-        
-        # Get recent game results
-        cursor.execute(
-            """
-            SELECT r.id, r.start_time, r.question_type, pr.correct, pr.position
-            FROM player_responses pr
-            JOIN rounds r ON pr.round_id = r.id
-            WHERE pr.player_id = ?
-            ORDER BY r.start_time DESC
-            LIMIT 10
-            """,
-            (player.id,)
-        )
-        recent_games = cursor.fetchall()
-        
-        # Get correctness by category
-        cursor.execute(
-            """
-            SELECT 
-                CASE
-                    WHEN r.question_type = 'movie' THEN 'Movies'
-                    WHEN r.question_type = 'trivia' THEN 
-                        (SELECT category FROM trivia_questions WHERE id = r.question_id)
-                    ELSE r.question_type
-                END as category,
-                COUNT(pr.id) as attempts,
-                SUM(CASE WHEN pr.correct = 1 THEN 1 ELSE 0 END) as correct
-            FROM player_responses pr
-            JOIN rounds r ON pr.round_id = r.id
-            WHERE pr.player_id = ?
-            GROUP BY category
-            ORDER BY attempts DESC
-            """,
-            (player.id,)
-        )
-        categories = cursor.fetchall()
-    
+
+        # The raw Row goes straight to the template (Jinja falls back
+        # to key lookup); building a Player model per request just to
+        # read id back out was pure validation overhead
+        player = player_row
+
+        # Stats, tournament history, recent games and categories all
+        # come back as JSON columns of a single row
+        cursor.execute(_SQL_PLAYER_PROFILE, (player_row["id"],))
+        profile_row = cursor.fetchone()
+        stats = json.loads(profile_row["stats_json"])
+        tournaments = json.loads(profile_row["tournaments_json"])
+        recent_games = json.loads(profile_row["recent_games_json"])
+        categories = json.loads(profile_row["categories_json"])
+
     return templates.TemplateResponse(
         "public/player_profile.html",
         {
@@ -198,33 +547,18 @@ async def player_profile(request: Request, handle: str):
     )
 
 @public_router.get("/tournaments", response_class=HTMLResponse)
+@_cached_page
 async def tournament_list(request: Request):
+    return await asyncio.to_thread(_tournament_list_page, request)
+
+def _tournament_list_page(request):
     with get_db() as conn:
         cursor = conn.cursor()
-        
+
         # Get all tournaments
-        cursor.execute(
-            """
-            SELECT t.*, 
-                   COUNT(DISTINCT tr.player_id) as player_count,
-                   (datetime(t.start_date, '+' || t.duration_days || ' days') < datetime('now')) as is_completed
-            FROM tournaments t
-            LEFT JOIN tournament_results tr ON t.id = tr.tournament_id
-            GROUP BY t.id
-            ORDER BY 
-                CASE 
-                    WHEN datetime(t.start_date) <= datetime('now') AND 
-                         datetime(t.start_date, '+' || t.duration_days || ' days') >= datetime('now')
-                    THEN 0
-                    WHEN datetime(t.start_date) > datetime('now')
-                    THEN 1
-                    ELSE 2
-                END,
-                t.start_date DESC
-            """
-        )
+        cursor.execute(_SQL_TOURNAMENT_LIST)
         tournaments_data = cursor.fetchall()
-    
+
     return templates.TemplateResponse(
         "public/tournaments.html",
         {
@@ -234,155 +568,88 @@ async def tournament_list(request: Request):
     )
 
 @public_router.get("/tournaments/{tournament_id}", response_class=HTMLResponse)
+@_cached_page
 async def tournament_detail(request: Request, tournament_id: int):
+    return await asyncio.to_thread(_tournament_detail_page, request, tournament_id)
+
+def _tournament_detail_page(request, tournament_id):
     with get_db() as conn:
         cursor = conn.cursor()
-        
+
         # Get tournament details
-        cursor.execute("SELECT * FROM tournaments WHERE id = ?", (tournament_id,))
+        cursor.execute(_SQL_TOURNAMENT_BY_ID, (tournament_id,))
         tournament_row = cursor.fetchone()
         if not tournament_row:
             raise HTTPException(status_code=404, detail="Tournament not found")
-        
-        tournament = Tournament.from_db_row(dict(tournament_row))
-        
+
+        tournament = _tournament_view(tournament_row)
+
         # Get tournament top players
-        cursor.execute(
-            """
-            SELECT tr.player_id, p.handle, p.display_name, 
-                   tr.total_points, tr.final_position, tr.bonus_points
-            FROM tournament_results tr
-            JOIN players p ON tr.player_id = p.id
-            WHERE tr.tournament_id = ?
-            ORDER BY tr.final_position IS NULL, tr.final_position ASC, tr.total_points DESC
-            LIMIT 10
-            """,
-            (tournament_id,)
-        )
+        cursor.execute(_SQL_TOURNAMENT_TOP_PLAYERS, (tournament_id,))
         top_players = cursor.fetchall()
-        
-        # Get tournament rounds
-        cursor.execute(
-            """
-            SELECT r.id, r.start_time, r.question_type, 
-                   COUNT(pr.id) as response_count,
-                   SUM(CASE WHEN pr.correct = 1 THEN 1 ELSE 0 END) as correct_count
-            FROM rounds r
-            LEFT JOIN player_responses pr ON r.id = pr.round_id
-            WHERE r.tournament_id = ?
-            GROUP BY r.id
-            ORDER BY r.start_time DESC
-            LIMIT 20
-            """,
-            (tournament_id,)
-        )
-        rounds = cursor.fetchall()
-        
+
         # Get tournament statistics
-        cursor.execute(
-            """
-            SELECT 
-                COUNT(DISTINCT pr.player_id) as total_players,
-                COUNT(DISTINCT r.id) as total_rounds,
-                SUM(CASE WHEN pr.correct = 1 THEN 1 ELSE 0 END) as total_correct,
-                COUNT(pr.id) as total_responses,
-                CASE 
-                    WHEN COUNT(pr.id) > 0 
-                    THEN ROUND(SUM(CASE WHEN pr.correct = 1 THEN 1.0 ELSE 0.0 END) / COUNT(pr.id) * 100, 1)
-                    ELSE 0
-                END as success_rate
-            FROM rounds r
-            LEFT JOIN player_responses pr ON r.id = pr.round_id
-            WHERE r.tournament_id = ?
-            """,
-            (tournament_id,)
-        )
-        stats = dict(cursor.fetchone())
-    
+        cursor.execute(_SQL_TOURNAMENT_STATS, (tournament_id,))
+        stats = cursor.fetchone()  # sqlite3.Row: Jinja reads it by key
+
+    # The rounds list lives below the fold, so the template pulls it
+    # lazily from the /rounds fragment instead of paying its GROUP BY
+    # on the critical path here
     return templates.TemplateResponse(
         "public/tournament_detail.html",
         {
             "request": request,
             "tournament": tournament,
             "top_players": top_players,
-            "rounds": rounds,
             "stats": stats
         }
     )
 
+@public_router.get("/tournaments/{tournament_id}/rounds", response_class=HTMLResponse)
+@_cached_page
+async def tournament_rounds(request: Request, tournament_id: int):
+    return await asyncio.to_thread(_tournament_rounds_fragment, request, tournament_id)
+
+def _tournament_rounds_fragment(request, tournament_id):
+    """HTML fragment with the tournament's recent rounds table.
+
+    Loaded by the detail page when the section scrolls into view, so the
+    initial render skips the per-round response aggregation entirely.
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_TOURNAMENT_ROUNDS, (tournament_id,))
+        rounds = cursor.fetchall()
+
+    return templates.TemplateResponse(
+        "public/partials/tournament_rounds.html",
+        {
+            "request": request,
+            "rounds": rounds
+        }
+    )
+
 @public_router.get("/", response_class=HTMLResponse)
+@_cached_page
 async def public_home(request: Request):
+    return await asyncio.to_thread(_public_home_page, request)
+
+def _public_home_page(request):
     with get_db() as conn:
         cursor = conn.cursor()
-        
-        # Get overall statistics
-        cursor.execute(
-            """
-            SELECT 
-                COUNT(DISTINCT r.id) as total_rounds,
-                COUNT(DISTINCT pr.player_id) as total_players,
-                SUM(CASE WHEN pr.correct = 1 THEN 1 ELSE 0 END) as total_correct,
-                COUNT(pr.id) as total_responses,
-                CASE 
-                    WHEN COUNT(pr.id) > 0 
-                    THEN ROUND(SUM(CASE WHEN pr.correct = 1 THEN 1.0 ELSE 0.0 END) / COUNT(pr.id) * 100, 1)
-                    ELSE 0
-                END as success_rate
-            FROM rounds r
-            LEFT JOIN player_responses pr ON r.id = pr.round_id
-            """
-        )
-        stats = dict(cursor.fetchone())
-        
-        # Get top players
-        cursor.execute(
-            """
-            SELECT p.id, p.handle, p.display_name,
-                COUNT(CASE WHEN pr.correct = 1 THEN 1 END) as correct_count,
-                COUNT(pr.id) as total_attempts,
-                SUM(rr.points_earned) as total_points
-            FROM players p
-            LEFT JOIN player_responses pr ON p.id = pr.player_id
-            LEFT JOIN round_results rr ON p.id = rr.player_id
-            GROUP BY p.id, p.handle, p.display_name
-            HAVING total_attempts > 0
-            ORDER BY total_points DESC
-            LIMIT 5
-            """
-        )
-        top_players = cursor.fetchall()
-        
-        # Get active tournaments
-        cursor.execute(
-            """
-            SELECT t.id, t.name, t.start_date, t.duration_days,
-                   COUNT(DISTINCT tr.player_id) as player_count
-            FROM tournaments t
-            LEFT JOIN tournament_results tr ON t.id = tr.tournament_id
-            WHERE datetime(t.start_date) <= datetime('now') 
-            AND datetime(t.start_date, '+' || t.duration_days || ' days') >= datetime('now')
-            GROUP BY t.id
-            ORDER BY t.start_date ASC
-            LIMIT 3
-            """
-        )
-        active_tournaments = cursor.fetchall()
-        
-        # Get recent rounds
-        cursor.execute(
-            """
-            SELECT r.id, r.start_time, r.question_type, 
-                   COUNT(pr.id) as response_count,
-                   SUM(CASE WHEN pr.correct = 1 THEN 1 ELSE 0 END) as correct_count
-            FROM rounds r
-            LEFT JOIN player_responses pr ON r.id = pr.round_id
-            GROUP BY r.id
-            ORDER BY r.start_time DESC
-            LIMIT 5
-            """
-        )
-        recent_rounds = cursor.fetchall()
-    
+
+        # All four dashboard sections come back from one statement,
+        # tagged by kind; decode each json_object payload into the
+        # dicts the template context expects
+        sections = {"stats": [], "top": [], "active": [], "recent": []}
+        for kind, _rn, payload in cursor.execute(_SQL_HOME_COMBINED):
+            sections[kind].append(json.loads(payload))
+
+        stats = sections["stats"][0] if sections["stats"] else {}
+        top_players = sections["top"]
+        active_tournaments = sections["active"]
+        recent_rounds = sections["recent"]
+
     return templates.TemplateResponse(
         "public/index.html",
         {